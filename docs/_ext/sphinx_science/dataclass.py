@@ -49,13 +49,15 @@ class RenderDataclass(DocGenDirective):
                 ),
             )
 
-        seen = set[DataclassInfo]()
+        # N.B.: DataclassInfo hashes structurally over all its field info; so we de-dup on the
+        # described type instead.
+        seen = set[type]()
         for data_type_info in iter_dataclass_info(
             dataclass_entrypoint, include_hidden=False, include_inlined=False
         ):
-            if data_type_info in seen:
+            if data_type_info.type in seen:
                 continue
-            seen.add(data_type_info)
+            seen.add(data_type_info.type)
             yield doc(data_type_info)
 
     required_arguments = 1
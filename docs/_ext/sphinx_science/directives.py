@@ -6,10 +6,12 @@ from __future__ import annotations
 import shutil
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import cache
 from importlib.metadata import EntryPoint
 from pathlib import Path
 from textwrap import dedent
-from typing import Iterable, Iterator, Mapping, NewType
+from typing import ClassVar, Iterable, Iterator, Mapping, NewType
+from weakref import WeakKeyDictionary
 
 from docutils import nodes
 from docutils.parsers.rst import Directive, directives
@@ -17,6 +19,7 @@ from docutils.statemachine import StringList
 from sphinx import addnodes
 from sphinx.application import Sphinx
 from sphinx.environment import BuildEnvironment
+from sphinx_science.render import make_id
 
 from science.frozendict import FrozenDict
 
@@ -24,13 +27,14 @@ Id = NewType("Id", str)
 
 
 def type_id(type_: type) -> Id:
-    return Id(nodes.make_id(f"{type_.__module__}.{type_.__qualname__}"))
+    return Id(make_id(f"{type_.__module__}.{type_.__qualname__}"))
 
 
 def create_type_reference(type_: type) -> str:
     return f"{type_.__module__}:{type_.__qualname__}"
 
 
+@cache
 def parse_type_reference(type_reference: str) -> type:
     return EntryPoint(name="", group="", value=type_reference).load()
 
@@ -118,6 +122,85 @@ class _GenNode(nodes.General, nodes.Element):
     pass
 
 
+@dataclass(frozen=True)
+class _SynthesizedConfig:
+    srcdir: Path
+    out_dir: Path
+    doc_gen_directive_name: str
+    doc_gen_directive: type[DocGenDirective]
+    generated_for: dict[str, addnodes.toctree] = field(default_factory=dict)
+    gen_nodes: dict[str, list[_GenNode]] = field(default_factory=dict)
+
+
+class _Synthesized(Directive):
+    config: ClassVar[_SynthesizedConfig]
+
+    def run(self) -> list[nodes.Node]:
+        config = self.config
+        current_source = self.state.document.current_source
+        assert current_source is not None, (
+            f"We always expect documents we handle to have a source. "
+            f"This document does not: {self.state.document}"
+        )
+        if generated_toc_node := config.generated_for.get(current_source):
+            # N.B.: We use the `env-get-outdated` event below to manually read doctrees behind the
+            # back of Sphinx which triggers this directive the 1st time and generates new docs
+            # files that we tell Sphinx about in that event (by mutating `added`). Later in the
+            # Sphinx life-cycle, it does its own read of all known doctrees triggering this
+            # directive a second time. On the second time around we want to skip the generation
+            # process.
+            return [generated_toc_node]
+
+        source = Path(current_source)
+        docname = source.relative_to(config.srcdir).with_suffix("")
+        dest_dir = config.out_dir / docname
+        dest_dir.mkdir(parents=True, exist_ok=True)
+
+        toctree_maxdepth = self.options.pop("toctree_maxdepth", None)
+        toctree_hidden = "toctree_hidden" in self.options
+        if toctree_hidden:
+            self.options.pop("toctree_hidden")
+
+        docnames = list[str]()
+        # These are (title, ref) pairs, where ref can be a document or an external link, and title
+        # can be None if the document's title should be used.
+        entries = list[tuple[str | None, str]]()
+        for doc in config.doc_gen_directive.enumerate_docs(
+            DirectiveSpec(
+                name=config.doc_gen_directive_name,
+                args=tuple(self.arguments),
+                options=FrozenDict(self.options),
+                content=self.content,
+            )
+        ):
+            generated_docname = str(doc.write(dest_dir).relative_to(config.srcdir).with_suffix(""))
+            docnames.append(generated_docname)
+            entries.append((None, generated_docname))
+
+        gen_node = _GenNode()
+        gen_node["docnames"] = docnames
+        config.gen_nodes.setdefault(docname.as_posix(), []).append(gen_node)
+
+        toc_node = addnodes.toctree()
+        toc_node["glob"] = False
+        toc_node["hidden"] = toctree_hidden
+        if toctree_maxdepth:
+            toc_node["maxdepth"] = toctree_maxdepth
+        toc_node["includefiles"] = docnames
+        toc_node["entries"] = entries
+
+        config.generated_for[current_source] = toc_node
+        return [gen_node, toc_node]
+
+
+# N.B.: All doc gen directives share an output directory; so we only clear it out once per build.
+_CLEANED_OUT_DIRS = WeakKeyDictionary[Sphinx, set[Path]]()
+
+# N.B.: Each doc gen directive registers its own `env-get-outdated` handler, but reading a doc runs
+# all the directives it uses; so we track the docs read per build across all the handlers.
+_READ_DOCNAMES = WeakKeyDictionary[Sphinx, set[str]]()
+
+
 @dataclass(frozen=True)
 class _MultiDocGen:
     @classmethod
@@ -128,11 +211,22 @@ class _MultiDocGen:
         app.add_directive(name=doc_gen_directive_name, cls=doc_gen_directive)
 
         out_dir = Path(app.srcdir) / "_"
-        shutil.rmtree(out_dir, ignore_errors=True)
-
-        generated_for = dict[Path, addnodes.toctree]()
+        cleaned_out_dirs = _CLEANED_OUT_DIRS.setdefault(app, set[Path]())
+        if out_dir not in cleaned_out_dirs:
+            shutil.rmtree(out_dir, ignore_errors=True)
+            cleaned_out_dirs.add(out_dir)
+
+        synthesized_config = _SynthesizedConfig(
+            srcdir=Path(app.srcdir),
+            out_dir=out_dir,
+            doc_gen_directive_name=doc_gen_directive_name,
+            doc_gen_directive=doc_gen_directive,
+        )
+        gen_nodes = synthesized_config.gen_nodes
+        read_docnames = _READ_DOCNAMES.setdefault(app, set[str]())
 
-        class Synthesized(Directive):
+        class Synthesized(_Synthesized):
+            config = synthesized_config
             has_content = getattr(doc_gen_directive, "has_content", False)
             option_spec = {
                 **getattr(doc_gen_directive, "option_spec", {}),
@@ -142,72 +236,28 @@ class _MultiDocGen:
             required_arguments = getattr(doc_gen_directive, "required_arguments", 0)
             optional_arguments = getattr(doc_gen_directive, "optional_arguments", 0)
 
-            def run(self) -> list[nodes.Node]:
-                assert self.state.document.current_source is not None, (
-                    f"We always expect documents we handle to have a source. "
-                    f"This document does not: {self.state.document}"
-                )
-                source = Path(self.state.document.current_source)
-                if generated_toc_node := generated_for.get(source):
-                    # N.B.: We use the `env-get-outdated` event below to manually read doctrees
-                    # behind the back of Sphinx which triggers this directive the 1st time and
-                    # generates new docs files that we tell Sphinx about in that event (by mutating
-                    # `added`). Later in the Sphinx life-cycle, it does its own read of all known
-                    # doctrees triggering this directive a second time. On the second time around we
-                    # want to skip the generation process.
-                    return [generated_toc_node]
-
-                dest_dir = out_dir / source.relative_to(app.srcdir).with_suffix("")
-                dest_dir.mkdir(parents=True, exist_ok=True)
-
-                toctree_maxdepth = self.options.pop("toctree_maxdepth", None)
-                toctree_hidden = "toctree_hidden" in self.options
-                if toctree_hidden:
-                    self.options.pop("toctree_hidden")
-
-                docnames = tuple(
-                    str(doc.write(dest_dir).relative_to(app.srcdir).with_suffix(""))
-                    for doc in doc_gen_directive.enumerate_docs(
-                        DirectiveSpec(
-                            name=doc_gen_directive_name,
-                            args=tuple(self.arguments),
-                            options=FrozenDict(self.options),
-                            content=self.content,
-                        )
-                    )
-                )
-
-                gen_node = _GenNode()
-                gen_node["docnames"] = docnames
-
-                toc_node = addnodes.toctree()
-                toc_node["glob"] = False
-                toc_node["hidden"] = toctree_hidden
-                if toctree_maxdepth:
-                    toc_node["maxdepth"] = toctree_maxdepth
-                toc_node["includefiles"] = docnames
-
-                # These are (title, ref) pairs, where ref can be a document or an external link,
-                # and title can be None if the document's title should be used.
-                toc_node["entries"] = [(None, docname) for docname in docnames]
-
-                generated_for[source] = toc_node
-                return [gen_node, toc_node]
-
         app.add_directive(name=directive_name, cls=Synthesized)
 
         def env_get_outdated(
-            _app: Sphinx, env: BuildEnvironment, added: set[str], changed: set[str], *_ignored
+            _app: Sphinx, _env: BuildEnvironment, added: set[str], changed: set[str], *_ignored
         ) -> Iterable[str]:
             for docname in added | changed:
-                app.builder.read_doc(docname)
-                for gen_node in env.get_doctree(docname).findall(_GenNode):
+                # N.B.: The doc may already have been read by the `env-get-outdated` handler of
+                # another doc gen directive; whether or not the doc uses either directive.
+                if docname not in read_docnames:
+                    read_docnames.add(docname)
+                    app.builder.read_doc(docname)
+                for gen_node in gen_nodes.get(docname, ()):
                     added.update(gen_node["docnames"])
             return ()
 
         app.connect("env-get-outdated", env_get_outdated)
 
-        def doctree_resolved(_app: Sphinx, doctree: nodes.document, _docname: str) -> None:
+        def doctree_resolved(_app: Sphinx, doctree: nodes.document, docname: str) -> None:
+            # N.B.: Only documents that use this directive can contain generator nodes; so we avoid
+            # walking the doctrees of all other documents.
+            if docname not in gen_nodes:
+                return
             for gen_node in doctree.findall(_GenNode):
                 gen_node.replace_self([])
 
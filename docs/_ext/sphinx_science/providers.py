@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import dataclasses
+from functools import cache
 from typing import Iterator
 
 from docutils import nodes
@@ -16,6 +17,11 @@ from science.frozendict import FrozenDict
 from science.providers import ProviderInfo
 
 
+@cache
+def _builtin_providers() -> tuple[ProviderInfo, ...]:
+    return tuple(providers.iter_builtin_providers())
+
+
 class RenderProviders(MarkdownParser, DocGenDirective):
     @classmethod
     def enumerate_docs(cls, directive_spec: DirectiveSpec) -> Iterator[Doc]:
@@ -23,7 +29,7 @@ class RenderProviders(MarkdownParser, DocGenDirective):
             {**directive_spec.options, **TOMLTypeRenderer.create_options(recurse_tables=False)}
         )
 
-        for provider_info in providers.iter_builtin_providers():
+        for provider_info in _builtin_providers():
             slug = provider_info.short_name or provider_info.fully_qualified_name
             yield Doc(
                 id=type_id(provider_info.type),
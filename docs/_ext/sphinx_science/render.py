@@ -3,7 +3,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from functools import cached_property
+from functools import cache, lru_cache
 from typing import Iterable, Self, final
 
 from docutils import nodes
@@ -28,6 +28,16 @@ class Link:
     icon: Icon | None = None
 
 
+@lru_cache(maxsize=2048)
+def make_id(name: str) -> str:
+    return nodes.make_id(name)
+
+
+@lru_cache(maxsize=2048)
+def _fully_normalize_name(name: str) -> str:
+    return nodes.fully_normalize_name(name)
+
+
 @dataclass
 class Section:
     @classmethod
@@ -35,8 +45,8 @@ class Section:
         section = nodes.section(
             "",
             nodes.title(text=title),
-            ids=[nodes.make_id(name)],
-            names=[nodes.fully_normalize_name(name)],
+            ids=[make_id(name)],
+            names=[_fully_normalize_name(name)],
         )
         return cls(name=name, node=section)
 
@@ -55,19 +65,30 @@ class Section:
         return subsection
 
 
-class MarkdownParser:
-    ENABLE_EXTENSIONS = ["linkify"]
+# N.B.: Sphinx creates a fresh directive instance per directive invocation; so we share parsers
+# across instances since they are expensive to construct and each render creates a fresh docutils
+# document.
+@cache
+def _create_markdown_parser(enable_extensions: frozenset[str]) -> MarkdownIt:
+    return create_md_parser(
+        MdParserConfig(enable_extensions=set(enable_extensions)), DocutilsRenderer
+    )
 
-    @cached_property
-    def _markdown_parser(self) -> MarkdownIt:
-        return create_md_parser(
-            MdParserConfig(enable_extensions=set(self.ENABLE_EXTENSIONS)), DocutilsRenderer
-        )
+
+@lru_cache(maxsize=1024)
+def _render_markdown(enable_extensions: frozenset[str], text: str) -> tuple[nodes.Node, ...]:
+    document = _create_markdown_parser(enable_extensions).render(text, env={})
+    return tuple(document.children)
+
+
+class MarkdownParser:
+    ENABLE_EXTENSIONS = frozenset(["linkify"])
 
     @final
     def parse_markdown(self, text: str) -> Iterable[nodes.Node]:
-        document = self._markdown_parser.render(text, env={})
-        return document.children
+        # N.B.: Docutils nodes are re-parented when attached to a document; so we always hand out
+        # fresh copies of the cached render results.
+        return (node.deepcopy() for node in _render_markdown(self.ENABLE_EXTENSIONS, text))
 
 
 class MarkdownDirective(MarkdownParser, Directive, ABC):
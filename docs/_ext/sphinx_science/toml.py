@@ -5,11 +5,11 @@ from __future__ import annotations
 
 import dataclasses
 import os
-from collections import deque
 from dataclasses import dataclass
 from enum import Enum
+from functools import cache
 from types import NoneType
-from typing import Any, Callable, Collection, Iterator, Mapping, Self
+from typing import Any, Callable, Collection, Iterator, Mapping, Self, cast
 
 from docutils import nodes
 from sphinx_science import directives
@@ -43,6 +43,22 @@ class PrimitiveType(TOMLType):
         return repr(value)
 
 
+_STRING = PrimitiveType("String")
+_BOOLEAN = PrimitiveType("Boolean")
+_INTEGER = PrimitiveType("Integer")
+_FLOAT = PrimitiveType("Float")
+_ANY = PrimitiveType("Any")
+
+# N.B.: Exact primitive types are by far the most common field types; so we dispatch these directly
+# before falling back to the full classification cascade.
+_PRIMITIVE_TYPES: dict[type, PrimitiveType] = {
+    str: _STRING,
+    bool: _BOOLEAN,
+    int: _INTEGER,
+    float: _FLOAT,
+}
+
+
 @dataclass(frozen=True)
 class ArrayType(TOMLType):
     @classmethod
@@ -76,9 +92,9 @@ class ChoiceType(TOMLType):
         cls, enum_type: type[Enum], toml_type_factory: Callable[[type | TypeInfo], TOMLType]
     ) -> Self:
         choices = tuple(choice.value for choice in enum_type)
-        choice_types = set(type(choice) for choice in choices)
-        assert len(choice_types) == 1
-        choice_type = toml_type_factory(choice_types.pop())
+        value_type = type(choices[0])
+        assert all(type(choice) is value_type for choice in choices[1:])
+        choice_type = toml_type_factory(value_type)
         return cls(
             label=" | ".join(f"{choice_type.render_value(choice)}" for choice in choices),
             renderer=lambda value: enum_type(value).value,
@@ -140,6 +156,27 @@ class MissingDocError(ValueError):
         super().__init__(error)
 
 
+@cache
+def _rendered_fields(data_type: type[Dataclass]) -> tuple[FieldInfo, ...]:
+    def iter_fields() -> Iterator[FieldInfo]:
+        for field in dataclass_info(data_type).field_info:
+            if field.hidden:
+                continue
+
+            if field.inline:
+                field_dataclass_type = field.type.dataclass
+                if not field_dataclass_type:
+                    raise TypeError(
+                        f"Can only inline fields of @dataclass type. Asked to inline {field}."
+                    )
+                yield from _rendered_fields(field_dataclass_type)
+                continue
+
+            yield field
+
+    return tuple(iter_fields())
+
+
 class TOMLTypeRenderer(MarkdownParser):
     OPTION_SPEC = FrozenDict(
         {
@@ -205,6 +242,7 @@ class TOMLTypeRenderer(MarkdownParser):
         self._link_tables = link_tables
         self._recurse_tables = recurse_tables
         self._rendered_types = set[type]()
+        self._toml_types = dict[tuple[TypeInfo, str | None, bool], TOMLType]()
 
     def _extract_data_type_name(
         self, data_type: type[Dataclass] | DataclassInfo, *fallback_names: str
@@ -222,15 +260,18 @@ class TOMLTypeRenderer(MarkdownParser):
 
     def render_field(self, field: FieldInfo, owner: type[Dataclass]) -> Iterator[nodes.Node]:
         toml_type = self.as_toml_type(field.type, name=field.name, reference=field.reference)
-        yield from self.parse_markdown(f"*type: {toml_type.label}*")
+        labels = [f"*type: {toml_type.label}*"]
         if (
             field.has_default
             and field.default is not None
             and (field.default or field.type.issubtype(bool, str, int, float))
         ):
-            yield from self.parse_markdown(
-                f"*default*: **`{toml_type.render_value(field.default)}`**"
-            )
+            labels.append(f"*default*: **`{toml_type.render_value(field.default)}`**")
+
+        # N.B.: The labels are stand-alone blocks; so we parse them in one pass. We keep them
+        # separate from the field doc though, since the same labels repeat across many fields and
+        # parse results are cached.
+        yield from self.parse_markdown("\n\n".join(labels))
 
         if field.doc:
             yield from self.parse_markdown(field.doc)
@@ -238,54 +279,64 @@ class TOMLTypeRenderer(MarkdownParser):
             raise MissingDocError(owner, field)
 
     def render_dataclass(self, data_type: type[Dataclass]) -> Iterator[nodes.Node]:
-        if data_type in self._rendered_types:
-            return
+        # N.B.: We render referenced dataclasses depth-first in field order using an explicit stack
+        # instead of recursing; so referenced types that have already been rendered are skipped
+        # without re-entering this method.
+        data_types = [data_type]
+        while data_types:
+            data_type = data_types.pop()
+            if data_type in self._rendered_types:
+                continue
 
-        if self._rendered_types:
-            yield nodes.transition()
+            if self._rendered_types:
+                yield nodes.transition()
 
-        self._rendered_types.add(data_type)
+            self._rendered_types.add(data_type)
 
-        class_info = dataclass_info(data_type)
-        alias = self._extract_data_type_name(class_info)
-        dataclass_section = Section.create(title=alias)
-        if class_info.doc:
-            dataclass_section.extend(self.parse_markdown(class_info.doc))
-        elif not self._allow_missing_doc:
-            raise MissingDocError(class_info.type)
-        yield dataclass_section.node
-
-        fields = deque(class_info.field_info)
-        while fields:
-            field = fields.popleft()
-            if field.hidden:
-                continue
-
-            if field.inline:
-                field_dataclass_type = field.type.dataclass
-                if not field_dataclass_type:
-                    raise TypeError(
-                        f"Can only inline fields of @dataclass type. Asked to inline {field}."
-                    )
-                fields.extendleft(dataclass_info(field_dataclass_type).field_info)
-                continue
+            class_info = dataclass_info(data_type)
+            alias = self._extract_data_type_name(class_info)
+            dataclass_section = Section.create(title=alias)
+            if class_info.doc:
+                dataclass_section.extend(self.parse_markdown(class_info.doc))
+            elif not self._allow_missing_doc:
+                raise MissingDocError(class_info.type)
+            yield dataclass_section.node
 
-            field_section = dataclass_section.create_subsection(title=field.name, name=field.name)
-            field_section.extend(self.render_field(field, owner=class_info.type))
+            referenced_data_types = list[type[Dataclass]]()
+            for field in _rendered_fields(data_type):
+                field_section = dataclass_section.create_subsection(
+                    title=field.name, name=field.name
+                )
+                field_section.extend(self.render_field(field, owner=class_info.type))
 
-            if self._recurse_tables:
-                for field_type in field.type.origin_types:
-                    if dataclasses.is_dataclass(field_type):
-                        yield from self.render_dataclass(field_type)
-                if field.type.has_item_type and dataclasses.is_dataclass(field.type.item_type):
-                    yield from self.render_dataclass(field.type.item_type)
+                if self._recurse_tables:
+                    for field_type in field.type.origin_types:
+                        if dataclasses.is_dataclass(field_type):
+                            referenced_data_types.append(cast(type[Dataclass], field_type))
+                    if field.type.has_item_type and dataclasses.is_dataclass(field.type.item_type):
+                        referenced_data_types.append(cast(type[Dataclass], field.type.item_type))
+            data_types.extend(reversed(referenced_data_types))
 
     def as_toml_type(
         self, type_: type | TypeInfo, *, name: str | None = None, reference: bool = False
     ) -> TOMLType:
         type_info = type_ if isinstance(type_, TypeInfo) else TypeInfo(type_)
-
+        key = type_info, name, reference
+        toml_type = self._toml_types.get(key)
+        if toml_type is None:
+            toml_type = self._classify_toml_type(type_info, name=name, reference=reference)
+            self._toml_types[key] = toml_type
+        return toml_type
+
+    def _classify_toml_type(
+        self, type_info: TypeInfo, *, name: str | None, reference: bool
+    ) -> TOMLType:
         def toml_type():
+            if type_info.has_origin_type and (
+                primitive_type := _PRIMITIVE_TYPES.get(type_info.origin_type)
+            ):
+                return primitive_type
+
             if type_info.issubtype(Enum):
                 return ChoiceType.for_enum(
                     type_info.origin_type, toml_type_factory=self.as_toml_type
@@ -318,15 +369,15 @@ class TOMLTypeRenderer(MarkdownParser):
                 return UnionType.for_type_info(type_info, toml_type_factory=self.as_toml_type)
 
             if type_info.issubtype(str):
-                return PrimitiveType("String")
+                return _STRING
             if type_info.issubtype(bool):
-                return PrimitiveType("Boolean")
+                return _BOOLEAN
             if type_info.issubtype(int):
-                return PrimitiveType("Integer")
+                return _INTEGER
             if type_info.issubtype(float):
-                return PrimitiveType("Float")
+                return _FLOAT
             if type_info.type_ is Any:
-                return PrimitiveType("Any")
+                return _ANY
 
             if reference:
                 return self.as_toml_type(str)
@@ -339,4 +390,4 @@ class TOMLTypeRenderer(MarkdownParser):
         classified_type = toml_type()
         if not type_info.optional:
             return classified_type
-        return dataclasses.replace(toml_type(), label=f"{classified_type.label} (Optional)")
+        return dataclasses.replace(classified_type, label=f"{classified_type.label} (Optional)")
@@ -3,7 +3,6 @@
 
 from __future__ import annotations
 
-import glob
 import hashlib
 import io
 import itertools
@@ -15,12 +14,14 @@ import subprocess
 import sys
 import tarfile
 import tempfile
+import threading
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from functools import wraps
 from pathlib import Path, PurePath
 from textwrap import dedent
-from typing import Any, Callable, Collection, Iterable, TypeVar, cast
+from typing import Any, Callable, Collection, Iterable, Mapping, Sequence, TypeVar, cast
 
 import nox
 from nox import Session
@@ -122,12 +123,57 @@ def check_lift_manifest(session: Session):
     )
 
 
-def run_pex(session: Session, script, *args, silent=False, **env) -> Any | None:
-    pex_pex = session.cache_dir / PEX_PEX
+def shared_cache_dir(session: Session) -> Path:
+    cache_dir = Path(
+        os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+    )
+    shared_cache_dir = cache_dir / "science-nox"
+    try:
+        shared_cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        session.warn(f"Falling back to the nox cache dir since {shared_cache_dir} is unusable: {e}")
+        return session.cache_dir
+    return shared_cache_dir
+
+
+def ensure_pex_pex(session: Session) -> Path:
+    # N.B.: The PEX PEX is content-addressed by its requirement; so we share it across checkouts
+    # and build it atomically to ensure an interrupted build never leaves a truncated PEX behind.
+    pex_pex = shared_cache_dir(session) / PEX_PEX
     if not pex_pex.exists():
-        session.install(PEX_REQUIREMENT)
-        session.run("pex", PEX_REQUIREMENT, "--venv", "--sh-boot", "-o", str(pex_pex))
-        session.run("python", "-m", "pip", "uninstall", "-y", "pex")
+        # N.B.: We install Pex into a scratch dir instead of the session venv so there is nothing
+        # to uninstall afterwards.
+        with tempfile.TemporaryDirectory(dir=pex_pex.parent, prefix="pex-build.") as scratch:
+            session.run(
+                "python",
+                "-m",
+                "pip",
+                "install",
+                "--no-deps",
+                "--no-compile",
+                "--target",
+                scratch,
+                PEX_REQUIREMENT,
+                silent=True,
+            )
+            pex_pex_tmp = pex_pex.with_name(f"{pex_pex.name}.{os.getpid()}.tmp")
+            session.run(
+                "python",
+                "-m",
+                "pex",
+                PEX_REQUIREMENT,
+                "--venv",
+                "--sh-boot",
+                "-o",
+                str(pex_pex_tmp),
+                env={"PYTHONPATH": scratch},
+            )
+        os.replace(pex_pex_tmp, pex_pex)
+    return pex_pex
+
+
+def run_pex(session: Session, script, *args, silent=False, **env) -> Any | None:
+    pex_pex = ensure_pex_pex(session)
     return session.run(
         "python",
         str(pex_pex),
@@ -138,11 +184,73 @@ def run_pex(session: Session, script, *args, silent=False, **env) -> Any | None:
     )
 
 
+def run_concurrently(
+    session: Session, *commands: Sequence[str], env: Mapping[str, str] | None = None
+) -> None:
+    resolved_commands = []
+    for command in commands:
+        exe = shutil.which(command[0], path=session.bin)
+        if not exe:
+            session.error(f"Failed to find {command[0]} in {session.bin}.")
+        resolved_commands.append([exe, *command[1:]])
+
+    # N.B.: This mirrors the environment `session.run` sets up for commands run in the session venv,
+    # where a value of `None` un-sets the variable.
+    run_env = dict(os.environ)
+    for name, value in {**session.env, **(env or {})}.items():
+        if value is None:
+            run_env.pop(name, None)
+        else:
+            run_env[name] = value
+    run_env["PATH"] = os.pathsep.join([*(session.bin_paths or ()), run_env.get("PATH", "")])
+    run_env["VIRTUAL_ENV"] = session.virtualenv.location
+
+    def run(command: Sequence[str]) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            args=command, env=run_env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        )
+
+    # N.B.: Nox's `session.run` is not thread safe; so we run the subprocesses directly and log
+    # their output from this thread in submission order.
+    failed = []
+    with ThreadPoolExecutor(max_workers=min(len(commands), os.cpu_count() or 1)) as executor:
+        for command, result in zip(commands, executor.map(run, resolved_commands)):
+            session.log(" ".join(command))
+            if result.stdout:
+                session.log(result.stdout.rstrip())
+            if result.returncode != 0:
+                failed.append(f"{' '.join(command)} (exit code {result.returncode})")
+    if failed:
+        session.error("The following commands failed:\n" + "\n".join(failed))
+
+
+def run_pex_concurrently(session: Session, script, *arg_lists: Sequence[str]) -> None:
+    pex_pex = ensure_pex_pex(session)
+    run_concurrently(
+        session,
+        *(("python", str(pex_pex), *args) for args in arg_lists),
+        env={"PEX_SCRIPT": script},
+    )
+
+
+LOCK_CREATED: bool | None = None
+
+
 def maybe_create_lock(session: Session) -> bool:
-    all_requirements = [
-        BUILD_ROOT / "requirements.txt",
-        *(Path(p) for p in sorted(glob.glob(str(BUILD_ROOT / "nox-support" / "*-reqs.txt")))),
-    ]
+    # N.B.: A single nox invocation can run many sessions that each install locked requirements.
+    # Since nothing but this function changes the lock, we only need to check it once per process.
+    global LOCK_CREATED
+    if LOCK_CREATED is None:
+        LOCK_CREATED = _maybe_create_lock(session)
+    return LOCK_CREATED
+
+
+def _maybe_create_lock(session: Session) -> bool:
+    with os.scandir(BUILD_ROOT / "nox-support") as entries:
+        subset_requirements = sorted(
+            entry.path for entry in entries if entry.name.endswith("-reqs.txt") and entry.is_file()
+        )
+    all_requirements = [BUILD_ROOT / "requirements.txt", *map(Path, subset_requirements)]
     requirements_digest = hashlib.sha256()
     for requirements_file in all_requirements:
         requirements_digest.update(requirements_file.read_bytes())
@@ -150,6 +258,7 @@ def maybe_create_lock(session: Session) -> bool:
 
     create_lock = True
     lock_checksum_file = BUILD_ROOT / "nox-support" / "lock.checksums"
+    checksum_data: dict[str, Any] = {}
     if LOCK_FILE.exists() and lock_checksum_file.exists():
         try:
             checksum_data = json.loads(lock_checksum_file.read_text())
@@ -201,32 +310,51 @@ def maybe_create_lock(session: Session) -> bool:
             str(LOCK_FILE),
         )
         lock_checksum = hashlib.sha256(LOCK_FILE.read_bytes()).hexdigest()
-        lock_checksum_file.write_text(
-            json.dumps(
-                {"requirements_checksum": requirements_checksum, "lock_checksum": lock_checksum},
-                indent=2,
-                sort_keys=True,
-            )
-        )
 
+    # N.B.: Each exported subset lock is a function of the lock, the subset requirements and the
+    # complete platform; so we only re-export subsets when one of those has changed.
+    platform_checksum = hashlib.sha256(WINDOWS_AMD64_COMPLETE_PLATFORM.read_bytes()).hexdigest()
+    expected_subset_checksums = {} if create_lock else checksum_data.get("subset_checksums", {})
+    subset_checksums = {}
+    export_subset_args: list[tuple[str, ...]] = []
     for subset in all_requirements:
+        subset_digest = hashlib.sha256()
+        subset_digest.update(lock_checksum.encode("utf-8"))
+        subset_digest.update(platform_checksum.encode("utf-8"))
+        subset_digest.update(subset.read_bytes())
+        subset_checksum = subset_digest.hexdigest()
+        subset_key = subset.relative_to(BUILD_ROOT).as_posix()
+        subset_checksums[subset_key] = subset_checksum
+
         subset_lock = subset.with_suffix(".windows-amd64.lock.txt")
-        if not create_lock and subset_lock.exists():
+        if subset_lock.exists() and expected_subset_checksums.get(subset_key) == subset_checksum:
             continue
-        run_pex(
-            session,
-            "pex3",
-            "lock",
-            "export-subset",
-            "--lock",
-            str(LOCK_FILE),
-            "-r",
-            str(subset),
-            "--complete-platform",
-            str(WINDOWS_AMD64_COMPLETE_PLATFORM),
-            "-o",
-            str(subset_lock),
+        export_subset_args.append(
+            (
+                "lock",
+                "export-subset",
+                "--lock",
+                str(LOCK_FILE),
+                "-r",
+                str(subset),
+                "--complete-platform",
+                str(WINDOWS_AMD64_COMPLETE_PLATFORM),
+                "-o",
+                str(subset_lock),
+            )
         )
+    if export_subset_args:
+        run_pex_concurrently(session, "pex3", *export_subset_args)
+
+    updated_checksum_data = {
+        "requirements_checksum": requirements_checksum,
+        "lock_checksum": lock_checksum,
+        "subset_checksums": subset_checksums,
+    }
+    if updated_checksum_data != checksum_data:
+        tmp_checksum_file = lock_checksum_file.with_name(f"{lock_checksum_file.name}.tmp")
+        tmp_checksum_file.write_text(json.dumps(updated_checksum_data, indent=2, sort_keys=True))
+        os.replace(tmp_checksum_file, lock_checksum_file)
 
     return create_lock
 
@@ -234,6 +362,34 @@ def maybe_create_lock(session: Session) -> bool:
 def install_locked_requirements(session: Session, input_reqs: Iterable[Path]) -> None:
     maybe_create_lock(session)
 
+    # N.B.: Session venvs are re-used; so we record what we installed and skip re-installing when
+    # nothing has changed.
+    input_reqs = tuple(input_reqs)
+    inputs_digest = hashlib.sha256(PEX_REQUIREMENT.encode("utf-8"))
+    if OperatingSystem.WINDOWS is OS:
+        install_inputs = [
+            req_file.with_suffix(".windows-amd64.lock.txt") for req_file in input_reqs
+        ]
+    else:
+        install_inputs = [LOCK_FILE, *input_reqs]
+    for install_input in install_inputs:
+        inputs_digest.update(install_input.relative_to(BUILD_ROOT).as_posix().encode("utf-8"))
+        inputs_digest.update(install_input.read_bytes())
+    inputs_checksum = inputs_digest.hexdigest()
+
+    install_marker = Path(session.virtualenv.location) / ".science-nox-install.json"
+    force_install = os.environ.get("SCIENCE_NOX_FORCE_INSTALL", "0").lower() in ("1", "true")
+    if not force_install and install_marker.exists():
+        try:
+            installed_checksum = json.loads(install_marker.read_text())["inputs_checksum"]
+        except (IOError, ValueError, KeyError) as e:
+            session.warn(f"Failed to load install marker at {install_marker}: {e}")
+        else:
+            if installed_checksum == inputs_checksum:
+                session.log("Locked requirements are already installed.")
+                return
+    install_marker.unlink(missing_ok=True)
+
     if OperatingSystem.WINDOWS is OS:
         # N.B: We avoid this installation technique when not on Windows since it's a good deal
         # slower than using Pex.
@@ -255,6 +411,7 @@ def install_locked_requirements(session: Session, input_reqs: Iterable[Path]) ->
             str(LOCK_FILE),
             *itertools.chain.from_iterable(("-r", str(req_file)) for req_file in input_reqs),
         )
+    install_marker.write_text(json.dumps({"inputs_checksum": inputs_checksum}))
 
 
 def ensure_PBS_python_dist(target_triple: str) -> PurePath:
@@ -364,30 +521,35 @@ def python_session(
 PATHS_TO_CHECK = ["science", "tests", "test-support", "noxfile.py", "docs"]
 
 
-def run_black(session: Session, *args: str) -> None:
-    session.run("black", "--color", *PATHS_TO_CHECK, *args, *session.posargs)
+def black_command(session: Session, *args: str) -> tuple[str, ...]:
+    return ("black", "--color", *PATHS_TO_CHECK, *args, *session.posargs)
 
 
-def run_isort(session: Session, *args: str) -> None:
-    session.run("isort", *PATHS_TO_CHECK, *args, *session.posargs)
+def isort_command(session: Session, *args: str) -> tuple[str, ...]:
+    return ("isort", *PATHS_TO_CHECK, *args, *session.posargs)
 
 
-def run_autoflake(session: Session, *args: str) -> None:
-    session.run("autoflake", "--quiet", "--recursive", *PATHS_TO_CHECK, *args, *session.posargs)
+def autoflake_command(session: Session, *args: str) -> tuple[str, ...]:
+    return ("autoflake", "--quiet", "--recursive", *PATHS_TO_CHECK, *args, *session.posargs)
 
 
 @python_session()
 def fmt(session: Session) -> None:
-    run_black(session)
-    run_isort(session)
-    run_autoflake(session, "--remove-all-unused-imports", "--in-place")
+    # N.B.: These all re-write files in-place and black and isort must agree on the final form; so
+    # they run serially.
+    session.run(*black_command(session))
+    session.run(*isort_command(session))
+    session.run(*autoflake_command(session, "--remove-all-unused-imports", "--in-place"))
 
 
 @python_session(extra_reqs=["fmt"])
 def lint(session: Session) -> None:
-    run_black(session, "--check", "--diff")
-    run_isort(session, "--check-only")
-    run_autoflake(session, "--check")
+    run_concurrently(
+        session,
+        black_command(session, "--check", "--diff"),
+        isort_command(session, "--check-only"),
+        autoflake_command(session, "--check"),
+    )
 
 
 @python_session(include_project=True, extra_reqs=["doc", "test"])
@@ -403,65 +565,131 @@ DIST_DIR = BUILD_ROOT / "dist"
 PACKAGED: Path | None = None
 
 
+def zipapp_fingerprint() -> str:
+    digest = hashlib.sha256(REQUIRES_PYTHON_VERSION.encode("utf-8"))
+    inputs = [
+        # N.B.: This holds the zipapp build recipe.
+        BUILD_ROOT / "noxfile.py",
+        BUILD_ROOT / "pyproject.toml",
+        # N.B.: These feed the METADATA in the dist-info packed into the zipapp.
+        BUILD_ROOT / "README.md",
+        BUILD_ROOT / "LICENSE",
+        BUILD_ROOT / "requirements.txt",
+        BUILD_ROOT / "requirements.windows-amd64.lock.txt",
+        LOCK_FILE,
+    ]
+    inputs.extend(
+        sorted(
+            path
+            for path in (BUILD_ROOT / "science").rglob("*")
+            if path.is_file() and "__pycache__" not in path.parts
+        )
+    )
+    for path in inputs:
+        digest.update(path.relative_to(BUILD_ROOT).as_posix().encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def build_zipapp(session: Session, dest: Path) -> None:
+    venv_dir = Path(session.create_tmp()) / "science"
+    if OperatingSystem.WINDOWS is OS:
+        session.run("python", "-m", "venv", str(venv_dir))
+        session.run(
+            str(venv_dir / "Scripts" / "python.exe"),
+            "-m",
+            "pip",
+            "install",
+            "-r",
+            str(BUILD_ROOT / "requirements.windows-amd64.lock.txt"),
+            external=True,
+        )
+        session.run(
+            str(venv_dir / "Scripts" / "python.exe"),
+            "-m",
+            "pip",
+            "uninstall",
+            "--yes",
+            "pip",
+            external=True,
+        )
+        site_packages = str(venv_dir / "Lib" / "site-packages")
+    else:
+        run_pex(
+            session,
+            "pex3",
+            "venv",
+            "create",
+            "--force",
+            "-d",
+            str(venv_dir),
+            "-r",
+            str(BUILD_ROOT / "requirements.txt"),
+            "--lock",
+            str(LOCK_FILE),
+        )
+        site_packages = json.loads(
+            cast(str, run_pex(session, "pex3", "venv", "inspect", str(venv_dir), silent=True))
+        )["site_packages"]
+
+    # N.B.: The session venv already has setuptools (via shiv); so we skip setting up an isolated
+    # build env for it.
+    session.run(
+        "python",
+        "-m",
+        "pip",
+        "install",
+        "--prefix",
+        str(venv_dir),
+        "--no-deps",
+        "--no-build-isolation",
+        ".",
+    )
+
+    session.run(
+        "shiv",
+        "-p",
+        f"/usr/bin/env python{REQUIRES_PYTHON_VERSION}",
+        "-c",
+        "science",
+        "--site-packages",
+        str(site_packages),
+        "--reproducible",
+        "-o",
+        str(dest),
+    )
+
+
 def create_zipapp(session: Session) -> Path:
     global PACKAGED
     if PACKAGED is None:
-        venv_dir = Path(session.create_tmp()) / "science"
-        if OperatingSystem.WINDOWS is OS:
-            session.run("python", "-m", "venv", str(venv_dir))
-            session.run(
-                str(venv_dir / "Scripts" / "python.exe"),
-                "-m",
-                "pip",
-                "install",
-                "-r",
-                str(BUILD_ROOT / "requirements.windows-amd64.lock.txt"),
-                external=True,
-            )
-            session.run(
-                str(venv_dir / "Scripts" / "python.exe"),
-                "-m",
-                "pip",
-                "uninstall",
-                "--yes",
-                "pip",
-                external=True,
-            )
-            site_packages = str(venv_dir / "Lib" / "site-packages")
+        # N.B.: The zipapp is a pure function of the fingerprinted inputs (shiv builds are
+        # reproducible); so we keep content-addressed builds in the nox cache and re-use them
+        # across nox invocations. We don't keep these in the dist dir since release jobs publish
+        # everything there matching `science-*`.
+        zipapp_cache_dir = session.cache_dir / "zipapps"
+        zipapp_cache_dir.mkdir(parents=True, exist_ok=True)
+        cached = zipapp_cache_dir / f"science-{zipapp_fingerprint()}.pyz"
+        if cached.exists():
+            session.log(f"Re-using {cached} built from identical inputs.")
         else:
-            run_pex(
-                session,
-                "pex3",
-                "venv",
-                "create",
-                "--force",
-                "-d",
-                str(venv_dir),
-                "-r",
-                str(BUILD_ROOT / "requirements.txt"),
-                "--lock",
-                str(LOCK_FILE),
-            )
-            site_packages = json.loads(
-                cast(str, run_pex(session, "pex3", "venv", "inspect", str(venv_dir), silent=True))
-            )["site_packages"]
-
-        session.run("python", "-m", "pip", "install", "--prefix", str(venv_dir), "--no-deps", ".")
+            cached_tmp = cached.with_name(f"{cached.name}.{os.getpid()}.tmp")
+            build_zipapp(session, dest=cached_tmp)
+            os.replace(cached_tmp, cached)
+            for superseded in zipapp_cache_dir.glob("science-*.pyz"):
+                if superseded != cached:
+                    superseded.unlink(missing_ok=True)
 
         DIST_DIR.mkdir(parents=True, exist_ok=True)
         dest = DIST_DIR / "science.pyz"
-        session.run(
-            "shiv",
-            "-p",
-            f"/usr/bin/env python{REQUIRES_PYTHON_VERSION}",
-            "-c",
-            "science",
-            "--site-packages",
-            str(site_packages),
-            "--reproducible",
-            "-o",
-            str(dest),
-        )
+        dest_tmp = dest.with_name(f"{dest.name}.{os.getpid()}.tmp")
+        try:
+            os.link(cached, dest_tmp)
+        except OSError:
+            shutil.copy2(cached, dest_tmp)
+        os.replace(dest_tmp, dest)
         PACKAGED = dest.resolve()
     return PACKAGED
 
@@ -470,14 +698,35 @@ def create_zipapp(session: Session) -> Path:
 def test(session: Session) -> None:
     science_pyz = create_zipapp(session)
     test_env = {"BUILD_ROOT": str(BUILD_ROOT), "SCIENCE_TEST_PYZ_PATH": str(science_pyz)}
-    session.run("pytest", "-n" "auto", *(session.posargs or ["-v"]), env=test_env)
+    session.run("pytest", "-n", "auto", *(session.posargs or ["-v"]), env=test_env)
 
 
 def _run_sphinx(session: Session, builder_name: str) -> Path:
     docs_dir = BUILD_ROOT / "docs"
     build_dir = docs_dir / "build" / builder_name
-    shutil.rmtree(build_dir, ignore_errors=True)
-    session.run("sphinx-build", "-b", builder_name, "-aEW", str(docs_dir), str(build_dir))
+
+    # N.B.: We move any old build out of the way and delete it in the background while Sphinx runs
+    # since deleting large trees can be slow; on Windows especially. If the old build can't be moved
+    # (open handles on Windows or a stale dir already in the way), we fall back to deleting it in
+    # place. We also clean up any stale dirs left behind by runs that were killed.
+    stale_build_dir = build_dir.with_name(f"{build_dir.name}.stale-{os.getpid()}")
+    try:
+        os.replace(build_dir, stale_build_dir)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        shutil.rmtree(build_dir, ignore_errors=True)
+
+    def remove_stale_build_dirs() -> None:
+        for stale_dir in build_dir.parent.glob(f"{build_dir.name}.stale-*"):
+            shutil.rmtree(stale_dir, ignore_errors=True)
+
+    cleanup = threading.Thread(target=remove_stale_build_dirs)
+    cleanup.start()
+    try:
+        session.run("sphinx-build", "-b", builder_name, "-aEW", str(docs_dir), str(build_dir))
+    finally:
+        cleanup.join()
     return build_dir
 
 
@@ -7,6 +7,7 @@ import subprocess
 import tempfile
 from dataclasses import dataclass
 from datetime import timedelta
+from functools import cache
 from pathlib import Path
 
 from packaging.version import Version
@@ -14,7 +15,7 @@ from packaging.version import Version
 from science.fetcher import fetch_and_verify
 from science.hashing import Digest, Fingerprint
 from science.model import File, Ptex, ScieJump, Url
-from science.platform import Platform
+from science.platform import CURRENT_PLATFORM, Platform
 
 
 @dataclass(frozen=True)
@@ -28,7 +29,8 @@ def _load_project_release(
     binary_name: str,
     version: Version | None = None,
     fingerprint: Digest | Fingerprint | None = None,
-    platform: Platform = Platform.current(),
+    platform: Platform = CURRENT_PLATFORM,
+    show_progress: bool = True,
 ) -> _LoadResult:
     qualified_binary_name = platform.qualified_binary_name(binary_name)
     base_url = f"https://github.com/a-scie/{project_name}/releases"
@@ -43,11 +45,16 @@ def _load_project_release(
         fingerprint=fingerprint,
         executable=True,
         ttl=ttl,
+        show_progress=show_progress,
     )
     return _LoadResult(path=path, binary_name=qualified_binary_name)
 
 
-def jump(specification: ScieJump | None = None, platform: Platform = Platform.current()) -> Path:
+def jump(
+    specification: ScieJump | None = None,
+    platform: Platform = CURRENT_PLATFORM,
+    show_progress: bool = True,
+) -> Path:
     version = specification.version if specification else None
     fingerprint = specification.digest if specification and specification.digest else None
     return _load_project_release(
@@ -56,20 +63,24 @@ def jump(specification: ScieJump | None = None, platform: Platform = Platform.cu
         version=version,
         fingerprint=fingerprint,
         platform=platform,
+        show_progress=show_progress,
     ).path
 
 
+# N.B.: The scie-jump repo is not expected to change over the life of a science run; so we build it
+# just once even though both the native jump and each target platform's jump ask for it.
+@cache
 def custom_jump(repo_path: Path) -> Path:
     dist_dir = tempfile.mkdtemp()
     atexit.register(shutil.rmtree, dist_dir, ignore_errors=True)
     subprocess.run(
         args=["cargo", "run", "-p", "package", "--", dist_dir], cwd=repo_path, check=True
     )
-    return Path(dist_dir) / Platform.current().qualified_binary_name("scie-jump")
+    return Path(dist_dir) / CURRENT_PLATFORM.qualified_binary_name("scie-jump")
 
 
 def ptex(
-    dest_dir: Path, specification: Ptex | None = None, platform: Platform = Platform.current()
+    dest_dir: Path, specification: Ptex | None = None, platform: Platform = CURRENT_PLATFORM
 ) -> File:
     version = specification.version if specification else None
     fingerprint = specification.digest if specification and specification.digest else None
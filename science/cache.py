@@ -5,9 +5,10 @@ from __future__ import annotations
 
 import atexit
 import hashlib
+import time
 from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import timedelta
 from pathlib import Path
 from typing import Iterator, TypeAlias
 
@@ -30,13 +31,54 @@ class Missing:
 CacheResult: TypeAlias = Complete | Missing
 
 
-_TTL_EXPIRY_FORMAT = "%m/%d/%y %H:%M:%S"
+# N.B.: The expiry is stored as a little-endian Unix timestamp. Older versions of science stored a
+# formatted date which is a different size; so those TTL files just read as expired.
+_TTL_EXPIRY_SIZE = 8
+
+
+def _expired(ttl_file: Path) -> bool:
+    try:
+        expiry = ttl_file.read_bytes()
+    except OSError:
+        return True
+    if len(expiry) != _TTL_EXPIRY_SIZE:
+        return True
+    return time.time() > int.from_bytes(expiry, "little", signed=True)
+
+
+def _write_expiry(ttl_file: Path, ttl: timedelta) -> None:
+    expiry = int(time.time() + ttl.total_seconds())
+    ttl_file.write_bytes(expiry.to_bytes(_TTL_EXPIRY_SIZE, "little", signed=True))
 
 
 @dataclass(frozen=True)
 class DownloadCache:
     base_dir: Path
 
+    def _cached_file(self, url: str) -> Path:
+        return self.base_dir / hashlib.sha256(url.encode()).hexdigest()
+
+    def stale_etag(self, url: str) -> str | None:
+        """Returns the recorded ETag of the given url's cached content if that content has expired.
+
+        If the origin server still has content with the same ETag, the cached content can be
+        re-used by calling `refresh` instead of downloading it again.
+        """
+        cached_file = self._cached_file(url)
+        if not cached_file.exists() or not _expired(cached_file.with_suffix(".ttl")):
+            return None
+        try:
+            return cached_file.with_suffix(".etag").read_text().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def record_etag(self, url: str, etag: str) -> None:
+        self._cached_file(url).with_suffix(".etag").write_text(etag)
+
+    def refresh(self, url: str, ttl: timedelta) -> None:
+        """Extends the lifetime of the given url's cached content by the given ttl."""
+        _write_expiry(self._cached_file(url).with_suffix(".ttl"), ttl)
+
     @contextmanager
     def get_or_create(self, url: str, ttl: timedelta | None = None) -> Iterator[CacheResult]:
         """A context manager that yields a `cache result.
@@ -45,20 +87,11 @@ class DownloadCache:
         to the `Missing.work` path. Upon successful exit from this context manager, the given url's
         content will exist at the cache result path.
         """
-        cached_file = self.base_dir / hashlib.sha256(url.encode()).hexdigest()
+        cached_file = self._cached_file(url)
 
         ttl_file = cached_file.with_suffix(".ttl") if ttl else None
-        if ttl_file and not ttl_file.exists():
+        if ttl_file and _expired(ttl_file):
             cached_file.unlink(missing_ok=True)
-        elif ttl_file:
-            try:
-                datetime_object = datetime.strptime(
-                    ttl_file.read_text().strip(), _TTL_EXPIRY_FORMAT
-                )
-                if datetime.now() > datetime_object:
-                    cached_file.unlink(missing_ok=True)
-            except ValueError:
-                cached_file.unlink(missing_ok=True)
 
         if cached_file.exists():
             yield Complete(path=cached_file)
@@ -70,13 +103,14 @@ class DownloadCache:
                 yield Complete(path=cached_file)
                 return
 
+            cached_file.with_suffix(".etag").unlink(missing_ok=True)
             work = cached_file.with_name(f"{cached_file.name}.work")
             work.unlink(missing_ok=True)
             atexit.register(work.unlink, missing_ok=True)
             yield Missing(path=cached_file, work=work)
             work.rename(cached_file)
             if ttl_file and ttl:
-                ttl_file.write_text((datetime.now() + ttl).strftime(_TTL_EXPIRY_FORMAT))
+                _write_expiry(ttl_file, ttl)
 
 
 def science_cache() -> Path:
@@ -1,18 +1,24 @@
 # Copyright 2023 Science project contributors.
 # Licensed under the Apache License, Version 2.0 (see LICENSE).
 
+import functools
 import hashlib
-import io
+import mmap
 import os
 import subprocess
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Callable, Iterable
+
+import click
+from click.globals import pop_context, push_context
 
 from science import a_scie
 from science.commands import lift
 from science.commands.lift import LiftConfig, PlatformInfo
-from science.model import Application
+from science.fetcher import fetch_and_verify
+from science.model import Application, Fetch
 from science.platform import Platform
 
 
@@ -38,50 +44,151 @@ def assemble_scies(
     use_jump: Path | None,
     hash_functions: list[str],
 ) -> AssemblyInfo:
+    platforms = tuple(platforms or application.platforms)
+    _prefetch(lift_config, application, platforms, platform_info, fetch_scie_jumps=not use_jump)
+
     native_jump_path = (
         a_scie.custom_jump(repo_path=use_jump)
         if use_jump
         else a_scie.jump(platform=platform_info.current)
     )
 
-    scies = list[ScieAssembly]()
-    for platform, lift_manifest in lift.export_manifest(
-        lift_config, application, dest_dir=dest_dir, platforms=platforms
-    ):
-        jump_path = (
-            a_scie.custom_jump(repo_path=use_jump)
-            if use_jump
-            else a_scie.jump(specification=application.scie_jump, platform=platform)
-        )
-        platform_export_dir = lift_manifest.parent
-        subprocess.run(
-            args=[str(native_jump_path), "-sj", str(jump_path), lift_manifest],
-            cwd=platform_export_dir,
-            stdout=subprocess.DEVNULL,
-            check=True,
+    # N.B.: Manifest export runs serially here since it relies on the active click context, which
+    # is thread local, to find the science cache. With the downloads already prefetched, that leaves
+    # packing and hashing each scie as the slow part; so we do that in the background.
+    with ThreadPoolExecutor() as executor:
+        scie_assemblies = list[Future[ScieAssembly]]()
+        for platform, lift_manifest in lift.export_manifest(
+            lift_config, application, dest_dir=dest_dir, platforms=platforms
+        ):
+            jump_path = (
+                a_scie.custom_jump(repo_path=use_jump)
+                if use_jump
+                else a_scie.jump(specification=application.scie_jump, platform=platform)
+            )
+            scie_assemblies.append(
+                executor.submit(
+                    _assemble_scie,
+                    native_jump_path=native_jump_path,
+                    jump_path=jump_path,
+                    lift_manifest=lift_manifest,
+                    platform=platform,
+                    platform_info=platform_info,
+                    application_name=application.name,
+                    hash_functions=hash_functions,
+                )
+            )
+        scies = tuple(scie_assembly.result() for scie_assembly in scie_assemblies)
+
+    return AssemblyInfo(native_jump=native_jump_path, scies=scies)
+
+
+def _prefetch(
+    lift_config: LiftConfig,
+    application: Application,
+    platforms: Iterable[Platform],
+    platform_info: PlatformInfo,
+    fetch_scie_jumps: bool = True,
+) -> None:
+    """Warms the download cache with the scie-jumps and eagerly fetched files the build will need.
+
+    The build proceeds platform by platform; so without this, each download would wait on the one
+    before it. Since the downloads run concurrently, their progress bars are not shown.
+    """
+    downloads = list[Callable[[], Any]]()
+    if fetch_scie_jumps:
+        downloads.append(
+            functools.partial(a_scie.jump, platform=platform_info.current, show_progress=False)
         )
 
-        src_binary = platform_export_dir / platform_info.current.binary_name(application.name)
-        dst_binary_name = platform_info.binary_name(application.name, target_platform=platform)
-        dst_binary = platform_export_dir / dst_binary_name
-        if src_binary != dst_binary:
-            os.rename(src=src_binary, dst=dst_binary)
+    fetch_urls = set[str]()
+    for platform in platforms:
+        if fetch_scie_jumps:
+            downloads.append(
+                functools.partial(
+                    a_scie.jump,
+                    specification=application.scie_jump,
+                    platform=platform,
+                    show_progress=False,
+                )
+            )
+        _, files = lift.platform_files(lift_config, application, platform)
+        for file in files:
+            match file.source:
+                case Fetch(url=url, lazy=False) if url not in fetch_urls:
+                    fetch_urls.add(url)
+                    downloads.append(
+                        functools.partial(
+                            fetch_and_verify,
+                            url,
+                            fingerprint=file.digest,
+                            executable=file.is_executable,
+                            show_progress=False,
+                        )
+                    )
+
+    # N.B.: The science cache location is found via the active click context, which is thread
+    # local; so we make it visible in each worker thread. We just push it onto the thread's context
+    # stack instead of re-entering it since re-entry tracks depth on the shared context without
+    # synchronization and could close the context out from under the command.
+    ctx = click.get_current_context(silent=True)
+
+    def download(func: Callable[[], Any]) -> None:
+        if not ctx:
+            func()
+            return
+        push_context(ctx)
+        try:
+            func()
+        finally:
+            pop_context()
+
+    with ThreadPoolExecutor() as executor:
+        for _ in executor.map(download, downloads):
+            pass
+
+
+def _assemble_scie(
+    native_jump_path: Path,
+    jump_path: Path,
+    lift_manifest: Path,
+    platform: Platform,
+    platform_info: PlatformInfo,
+    application_name: str,
+    hash_functions: list[str],
+) -> ScieAssembly:
+    platform_export_dir = lift_manifest.parent
+    subprocess.run(
+        args=[str(native_jump_path), "-sj", str(jump_path), lift_manifest],
+        cwd=platform_export_dir,
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
 
-        hashes = list[Path]()
-        if hash_functions:
+    src_binary = platform_export_dir / platform_info.current.binary_name(application_name)
+    dst_binary_name = platform_info.binary_name(application_name, target_platform=platform)
+    dst_binary = platform_export_dir / dst_binary_name
+    if src_binary != dst_binary:
+        os.rename(src=src_binary, dst=dst_binary)
+
+    hashes = list[Path]()
+    if hash_functions:
+        hash_function_names = sorted(set(hash_functions))
+        with (
+            dst_binary.open(mode="rb") as fp,
+            mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as contents,
+            ThreadPoolExecutor(max_workers=len(hash_function_names)) as executor,
+        ):
+            # N.B.: Each hash is computed in a single `update` call which releases the GIL; so the
+            # hashes are computed in parallel over the one mapping of the scie.
             digests = tuple(
-                hashlib.new(hash_function) for hash_function in sorted(set(hash_functions))
+                executor.map(
+                    lambda hash_function: hashlib.new(hash_function, contents),
+                    hash_function_names,
+                )
             )
-            with dst_binary.open(mode="rb") as fp:
-                for chunk in iter(lambda: fp.read(io.DEFAULT_BUFFER_SIZE), b""):
-                    for digest in digests:
-                        digest.update(chunk)
-            for digest in digests:
-                checksum_file = dst_binary.with_name(f"{dst_binary_name}.{digest.name}")
-                checksum_file.write_text(f"{digest.hexdigest()} *{dst_binary_name}")
-                hashes.append(checksum_file)
-        scies.append(
-            ScieAssembly(lift_manifest=lift_manifest, scie=dst_binary, hashes=tuple(hashes))
-        )
-
-    return AssemblyInfo(native_jump=native_jump_path, scies=tuple(scies))
+        for digest in digests:
+            checksum_file = dst_binary.with_name(f"{dst_binary_name}.{digest.name}")
+            checksum_file.write_text(f"{digest.hexdigest()} *{dst_binary_name}")
+            hashes.append(checksum_file)
+    return ScieAssembly(lift_manifest=lift_manifest, scie=dst_binary, hashes=tuple(hashes))
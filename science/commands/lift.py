@@ -25,7 +25,7 @@ from science.model import (
     InterpreterGroup,
     ScieJump,
 )
-from science.platform import Platform
+from science.platform import CURRENT_PLATFORM, Platform
 
 
 @dataclass(frozen=True)
@@ -36,12 +36,12 @@ class AppInfo:
 
     @classmethod
     def parse(cls, value: str) -> AppInfo:
-        components = value.split("=", 1)
-        if len(components) != 2:
+        key, sep, val = value.partition("=")
+        if not sep:
             raise InputError(
                 f"Invalid app info. An app info entry must be of the form `<key>=<value>`: {value}"
             )
-        return cls(key=components[0], value=components[1])
+        return cls(key=key, value=val)
 
     key: str
     value: str
@@ -51,13 +51,13 @@ class AppInfo:
 class FileMapping:
     @classmethod
     def parse(cls, value: str) -> FileMapping:
-        components = value.split("=", 1)
-        if len(components) != 2:
+        id_, sep, path = value.partition("=")
+        if not sep:
             raise InputError(
                 "Invalid file mapping. A file mapping must be of the form "
                 f"`(<name>|<key>)=<path>`: {value}"
             )
-        return cls(id=components[0], path=Path(components[1]))
+        return cls(id=id_, path=Path(path))
 
     id: str
     path: Path
@@ -67,13 +67,12 @@ class FileMapping:
 class PlatformInfo:
     @classmethod
     def create(cls, application: Application, use_suffix: bool | None = None) -> PlatformInfo:
-        current = Platform.current()
         return cls(
-            current=current,
+            current=CURRENT_PLATFORM,
             use_suffix=(
                 use_suffix
                 if use_suffix is not None
-                else application.platforms != frozenset([current])
+                else application.platforms != frozenset([CURRENT_PLATFORM])
             ),
         )
 
@@ -98,6 +97,46 @@ class LiftConfig:
     platforms: tuple[Platform, ...] = ()
 
 
+def platform_files(
+    lift_config: LiftConfig, application: Application, platform: Platform
+) -> tuple[list[Distribution], list[File]]:
+    """Returns the interpreter distributions and files to include in the given platform's scie.
+
+    The laziness of any files identified by `lift_config.invert_lazy_ids` is inverted.
+    """
+    distributions = list[Distribution]()
+    files = list[File]()
+    inverted = list[str]()
+
+    def maybe_invert_lazy(file: File) -> File:
+        if file.id in lift_config.invert_lazy_ids:
+            match file.source:
+                case Fetch(_, lazy=lazy) as fetch:
+                    inverted.append(file.id)
+                    # MyPy does not handle dataclass_transform yet: https://github.com/python/mypy/issues/14293
+                    return dataclasses.replace(
+                        file, source=dataclasses.replace(fetch, lazy=not lazy)  # type: ignore[misc]
+                    )  # type: ignore[misc]
+                case Binding(name):
+                    raise InputError(f"Cannot make binding {name!r} non-lazy.")
+                case None:
+                    raise InputError(f"Cannot lazy fetch local file {file.name!r}.")
+        return file
+
+    for interpreter in application.interpreters:
+        distribution = interpreter.provider.distribution(platform)
+        if distribution:
+            distributions.append(distribution)
+            files.append(maybe_invert_lazy(distribution.file))
+    files.extend(map(maybe_invert_lazy, application.files))
+    if (actually_inverted := frozenset(inverted)) != lift_config.invert_lazy_ids:
+        raise InputError(
+            "There following files were not present to invert laziness for: "
+            f"{', '.join(sorted(lift_config.invert_lazy_ids - actually_inverted))}"
+        )
+    return distributions, files
+
+
 def export_manifest(
     lift_config: LiftConfig,
     application: Application,
@@ -106,47 +145,18 @@ def export_manifest(
     platforms: Iterable[Platform] | None = None,
 ) -> Iterator[tuple[Platform, Path]]:
     app_info = AppInfo.assemble(lift_config.app_info)
+    mapped_file_paths_by_id = {
+        file_mapping.id: file_mapping.path.resolve() for file_mapping in lift_config.file_mappings
+    }
 
     for platform in platforms or application.platforms:
         chroot = dest_dir / platform.value
         chroot.mkdir(parents=True, exist_ok=True)
 
         bindings = list[Command]()
-        distributions = list[Distribution]()
-
-        requested_files = deque[File]()
-        file_paths_by_id = {
-            file_mapping.id: file_mapping.path.resolve()
-            for file_mapping in lift_config.file_mappings
-        }
-        inverted = list[str]()
-
-        def maybe_invert_lazy(file: File) -> File:
-            if file.id in lift_config.invert_lazy_ids:
-                match file.source:
-                    case Fetch(_, lazy=lazy) as fetch:
-                        inverted.append(file.id)
-                        # MyPy does not handle dataclass_transform yet: https://github.com/python/mypy/issues/14293
-                        return dataclasses.replace(
-                            file, source=dataclasses.replace(fetch, lazy=not lazy)  # type: ignore[misc]
-                        )  # type: ignore[misc]
-                    case Binding(name):
-                        raise InputError(f"Cannot make binding {name!r} non-lazy.")
-                    case None:
-                        raise InputError(f"Cannot lazy fetch local file {file.name!r}.")
-            return file
-
-        for interpreter in application.interpreters:
-            distribution = interpreter.provider.distribution(platform)
-            if distribution:
-                distributions.append(distribution)
-                requested_files.append(maybe_invert_lazy(distribution.file))
-        requested_files.extend(map(maybe_invert_lazy, application.files))
-        if (actually_inverted := frozenset(inverted)) != lift_config.invert_lazy_ids:
-            raise InputError(
-                "There following files were not present to invert laziness for: "
-                f"{', '.join(sorted(lift_config.invert_lazy_ids - actually_inverted))}"
-            )
+        distributions, files = platform_files(lift_config, application, platform)
+        requested_files = deque(files)
+        file_paths_by_id = dict(mapped_file_paths_by_id)
 
         if any(isinstance(file.source, Fetch) and file.source.lazy for file in requested_files):
             ptex = a_scie.ptex(chroot, specification=application.ptex, platform=platform)
@@ -207,8 +217,10 @@ def export_manifest(
             elif file_path:
                 requested_file.maybe_check_digest(file_path)
                 target.parent.mkdir(parents=True, exist_ok=True)
-                if not target.exists():
+                try:
                     target.symlink_to(file_path)
+                except FileExistsError:
+                    pass
 
         lift_manifest = chroot / "lift.json"
 
@@ -40,7 +40,7 @@ from science.errors import InputError
 from science.fs import temporary_directory
 from science.model import Application
 from science.os import EXE_EXT
-from science.platform import Platform
+from science.platform import CURRENT_PLATFORM, Platform
 
 logger = logging.getLogger(__name__)
 
@@ -561,7 +561,7 @@ def use_platform_suffix_option():
             """
         ).format(
             suffixes="\n ".join(
-                f"{'*' if platform == Platform.current() else ' '} {platform.value}"
+                f"{'*' if platform == CURRENT_PLATFORM else ' '} {platform.value}"
                 for platform in Platform
             )
         ),
@@ -591,7 +591,9 @@ def export(
 
     application = parse_application(lift_config, config)
     platform_info = PlatformInfo.create(application, use_suffix=use_platform_suffix)
-    with temporary_directory(cleanup=True) as td:
+    # N.B.: We create the work dir in the dest dir to ensure the final moves are cheap renames.
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    with temporary_directory(cleanup=True, dir=dest_dir) as td:
         for _, manifest_path in lift.export_manifest(
             lift_config, application, dest_dir=td, platforms=lift_config.platforms
         ):
@@ -709,7 +711,12 @@ def _build(
             f"requires at least 0.9.0."
         )
 
-    with temporary_directory(cleanup=not preserve_sandbox) as td:
+    # N.B.: Unless we're preserving the sandbox, we create it in the dest dir to ensure the final
+    # moves of the (potentially large) scies are cheap renames.
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    with temporary_directory(
+        cleanup=not preserve_sandbox, dir=None if preserve_sandbox else dest_dir
+    ) as td:
         assembly_info = build.assemble_scies(
             lift_config=lift_config,
             application=application,
@@ -719,7 +726,6 @@ def _build(
             use_jump=use_jump,
             hash_functions=hash_functions,
         )
-        dest_dir.mkdir(parents=True, exist_ok=True)
 
         def move(path: Path) -> None:
             dst = dest_dir / path.name
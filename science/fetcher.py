@@ -89,9 +89,37 @@ def configured_client(url: Url, headers: Mapping[str, str] | None = None) -> htt
     return httpx.Client(follow_redirects=True, headers=headers, auth=auth)
 
 
+def _maybe_revalidate(
+    url: Url, ttl: timedelta | None = None, headers: Mapping[str, str] | None = None
+) -> None:
+    if not ttl:
+        return
+
+    cache = download_cache()
+    if not (etag := cache.stale_etag(url)):
+        return
+
+    # N.B.: This is just an optimization; so any failure here just falls back to a full download.
+    try:
+        with configured_client(url, {**(headers or {}), "If-None-Match": etag}) as client:
+            response = client.head(url)
+    except httpx.HTTPError as e:
+        logger.debug(f"Failed to re-validate cached content for {url}: {e}")
+        return
+    if response.status_code == httpx.codes.NOT_MODIFIED:
+        logger.debug(f"Re-using cached content for {url} with unchanged ETag {etag}.")
+        cache.refresh(url, ttl)
+
+
+def _maybe_record_etag(url: Url, ttl: timedelta | None, response: httpx.Response) -> None:
+    if ttl and (etag := response.headers.get("ETag")):
+        download_cache().record_etag(url, etag)
+
+
 def _fetch_to_cache(
     url: Url, ttl: timedelta | None = None, headers: Mapping[str, str] | None = None
 ) -> Path:
+    _maybe_revalidate(url, ttl, headers)
     with download_cache().get_or_create(url, ttl=ttl) as cache_result:
         match cache_result:
             case Missing(work=work):
@@ -101,6 +129,7 @@ def _fetch_to_cache(
                 ):
                     for data in response.iter_bytes():
                         cache_fp.write(data)
+                _maybe_record_etag(url, ttl, response)
     return cache_result.path
 
 
@@ -161,8 +190,10 @@ def fetch_and_verify(
     executable: bool = False,
     ttl: timedelta | None = None,
     headers: Mapping[str, str] | None = None,
+    show_progress: bool = True,
 ) -> Path:
     verified_fingerprint = False
+    _maybe_revalidate(url, ttl, headers)
     with download_cache().get_or_create(url, ttl=ttl) as cache_result:
         match cache_result:
             case Missing(work=work):
@@ -185,7 +216,11 @@ def fetch_and_verify(
                                 f"bytes, but advertises a Content-Length of {total} bytes."
                             )
                         with tqdm(
-                            total=total, unit_scale=True, unit_divisor=1024, unit="B"
+                            total=total,
+                            unit_scale=True,
+                            unit_divisor=1024,
+                            unit="B",
+                            disable=not show_progress,
                         ) as progress:
                             num_bytes_downloaded = response.num_bytes_downloaded
                             for data in response.iter_bytes():
@@ -210,6 +245,7 @@ def fetch_and_verify(
                     verified_fingerprint = True
                     if executable:
                         work.chmod(0o755)
+                    _maybe_record_etag(url, ttl, response)
 
     if not verified_fingerprint:
         expected_cached_digest = _maybe_expected_digest(
@@ -10,9 +10,9 @@ from typing import Iterator
 
 
 @contextmanager
-def temporary_directory(cleanup: bool) -> Iterator[Path]:
+def temporary_directory(cleanup: bool, dir: Path | None = None) -> Iterator[Path]:
     if cleanup:
-        with tempfile.TemporaryDirectory() as td:
+        with tempfile.TemporaryDirectory(dir=dir, prefix=".science-") as td:
             yield Path(td)
     else:
-        yield Path(tempfile.mkdtemp())
+        yield Path(tempfile.mkdtemp(dir=dir, prefix=".science-"))
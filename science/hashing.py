@@ -4,7 +4,6 @@
 from __future__ import annotations
 
 import hashlib
-import io
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
@@ -64,9 +63,8 @@ class Digest:
     @classmethod
     def hash(cls, path: Path, algorithm: str = DEFAULT_ALGORITHM) -> Digest:
         with path.open(mode="rb") as fp:
-            binary_hasher = cls.hasher(fp, algorithm=algorithm)
-            binary_hasher.read()
-            return binary_hasher.digest()
+            digest = hashlib.file_digest(fp, algorithm)
+            return cls(size=fp.tell(), fingerprint=Fingerprint(digest.hexdigest()))
 
 
 @dataclass(frozen=True)
@@ -103,10 +101,8 @@ class ExpectedDigest:
         subject = f"{subject} at {path}"
         self.maybe_check_size(subject=subject, actual_size=lambda: path.stat().st_size)
 
-        digest = hashlib.new(self.algorithm)
         with path.open(mode="rb") as fp:
-            for chunk in iter(lambda: fp.read(io.DEFAULT_BUFFER_SIZE), b""):
-                digest.update(chunk)
+            digest = hashlib.file_digest(fp, self.algorithm)
         self.check_fingerprint(subject=subject, actual_fingerprint=Fingerprint(digest.hexdigest()))
 
 
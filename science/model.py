@@ -33,7 +33,7 @@ from science.doc import Ref
 from science.errors import InputError
 from science.frozendict import FrozenDict
 from science.hashing import Digest, ExpectedDigest
-from science.platform import Platform
+from science.platform import CURRENT_PLATFORM, Platform
 
 
 class FileType(Enum):
@@ -476,7 +476,7 @@ class Application(Dataclass):
     description: str | None = None
     load_dotenv: bool = False
     build_info: BuildInfo | None = dataclasses.field(default=None, metadata=metadata(inline=True))
-    platforms: frozenset[Platform] = frozenset([Platform.current()])
+    platforms: frozenset[Platform] = frozenset([CURRENT_PLATFORM])
     base: str | None = dataclasses.field(
         default=None,
         metadata=metadata("An alternate path to use for the scie base `nce` CAS."),
@@ -23,7 +23,7 @@ class Platform(Enum):
 
     @classmethod
     def parse(cls, value: str) -> Platform:
-        return Platform.current() if "current" == value else Platform(value)
+        return CURRENT_PLATFORM if "current" == value else Platform(value)
 
     @classmethod
     def current(cls) -> Platform:
@@ -67,3 +67,6 @@ class Platform(Enum):
 
     def qualified_binary_name(self, binary_name: str) -> str:
         return f"{binary_name}-{self.value}{self.extension}"
+
+
+CURRENT_PLATFORM = Platform.current()
@@ -0,0 +1,55 @@
+# Copyright 2024 Science project contributors.
+# Licensed under the Apache License, Version 2.0 (see LICENSE).
+
+from datetime import timedelta
+from pathlib import Path
+
+from science.cache import Complete, DownloadCache, Missing
+
+URL = "https://example.org/latest/download/file"
+
+
+def populate(cache: DownloadCache, ttl: timedelta, content: str) -> None:
+    with cache.get_or_create(URL, ttl=ttl) as cache_result:
+        assert isinstance(cache_result, Missing)
+        cache_result.work.write_text(content)
+
+
+def test_stale_etag(tmp_path: Path) -> None:
+    cache = DownloadCache(base_dir=tmp_path)
+    assert cache.stale_etag(URL) is None
+
+    populate(cache, ttl=timedelta(days=1), content="v1")
+    cache.record_etag(URL, '"v1"')
+    assert cache.stale_etag(URL) is None, "Un-expired content should not need re-validation."
+
+    cache.refresh(URL, ttl=timedelta(seconds=-1))
+    assert '"v1"' == cache.stale_etag(URL)
+
+    cache.refresh(URL, ttl=timedelta(days=1))
+    assert cache.stale_etag(URL) is None
+    with cache.get_or_create(URL, ttl=timedelta(days=1)) as cache_result:
+        assert isinstance(cache_result, Complete)
+        assert "v1" == cache_result.path.read_text()
+
+
+def test_expired_content_discards_etag(tmp_path: Path) -> None:
+    cache = DownloadCache(base_dir=tmp_path)
+    populate(cache, ttl=timedelta(days=1), content="v1")
+    cache.record_etag(URL, '"v1"')
+
+    cache.refresh(URL, ttl=timedelta(seconds=-1))
+    populate(cache, ttl=timedelta(days=1), content="v2")
+    cache.refresh(URL, ttl=timedelta(seconds=-1))
+    assert cache.stale_etag(URL) is None, "The v1 ETag should not be re-used for v2 content."
+
+
+def test_legacy_ttl_format_expired(tmp_path: Path) -> None:
+    cache = DownloadCache(base_dir=tmp_path)
+    populate(cache, ttl=timedelta(days=1), content="v1")
+    cache.record_etag(URL, '"v1"')
+    assert cache.stale_etag(URL) is None
+
+    (ttl_file,) = tmp_path.glob("*.ttl")
+    ttl_file.write_text("12/31/99 23:59:59")
+    assert '"v1"' == cache.stale_etag(URL)